@@ -1,61 +1,97 @@
-"""Quatinuum Schemas for configurations, error models and more."""
-
-from quantinuum_schemas.models.backend_config import (
-    AerConfig,
-    AerStateConfig,
-    AerUnitaryConfig,
-    SeleneConfig,
-    BraketConfig,
-    IBMQConfig,
-    IBMQEmulatorConfig,
-    QuantinuumConfig,
-    QulacsConfig,
-    SelenePlusConfig,
-    HeliosConfig,
-    HeliosEmulatorConfig,
-)
-from quantinuum_schemas.models.emulator_config import (
-    ClassicalReplaySimulator,
-    CoinflipSimulator,
-    DepolarizingErrorModel,
-    HeliosCustomErrorModel,
-    HeliosRuntime,
-    MatrixProductStateSimulator,
-    NoErrorModel,
-    QSystemErrorModel,
-    SimpleRuntime,
-    StabilizerSimulator,
-    StatevectorSimulator,
-)
-from quantinuum_schemas.models.quantinuum_systems_noise import (
-    HeliosErrorParams,
-    UserErrorParams,
+"""Quatinuum Schemas for configurations, error models and more.
+
+Exported names are resolved lazily on first attribute access (PEP 562), so
+importing the package does not build the Pydantic schemas of every model.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Explicit re-exports, so type checkers see the lazily loaded names.
+    # pylint: disable=useless-import-alias
+    from quantinuum_schemas.models.backend_config import (
+        AerConfig as AerConfig,
+        AerStateConfig as AerStateConfig,
+        AerUnitaryConfig as AerUnitaryConfig,
+        SeleneConfig as SeleneConfig,
+        BraketConfig as BraketConfig,
+        IBMQConfig as IBMQConfig,
+        IBMQEmulatorConfig as IBMQEmulatorConfig,
+        QuantinuumConfig as QuantinuumConfig,
+        QulacsConfig as QulacsConfig,
+        SelenePlusConfig as SelenePlusConfig,
+        HeliosConfig as HeliosConfig,
+        HeliosEmulatorConfig as HeliosEmulatorConfig,
+    )
+    from quantinuum_schemas.models.emulator_config import (
+        ClassicalReplaySimulator as ClassicalReplaySimulator,
+        CoinflipSimulator as CoinflipSimulator,
+        DepolarizingErrorModel as DepolarizingErrorModel,
+        HeliosCustomErrorModel as HeliosCustomErrorModel,
+        HeliosRuntime as HeliosRuntime,
+        MatrixProductStateSimulator as MatrixProductStateSimulator,
+        NoErrorModel as NoErrorModel,
+        QSystemErrorModel as QSystemErrorModel,
+        SimpleRuntime as SimpleRuntime,
+        StabilizerSimulator as StabilizerSimulator,
+        StatevectorSimulator as StatevectorSimulator,
+    )
+    from quantinuum_schemas.models.quantinuum_systems_noise import (
+        HeliosErrorParams as HeliosErrorParams,
+        UserErrorParams as UserErrorParams,
+    )
+
+_BACKEND_CONFIG = "quantinuum_schemas.models.backend_config"
+_EMULATOR_CONFIG = "quantinuum_schemas.models.emulator_config"
+_SYSTEMS_NOISE = "quantinuum_schemas.models.quantinuum_systems_noise"
+
+# The public API: (exported name, module, attribute), resolved on first access.
+_EXPORTS: tuple[tuple[str, str, str], ...] = (
+    ("AerConfig", _BACKEND_CONFIG, "AerConfig"),
+    ("AerStateConfig", _BACKEND_CONFIG, "AerStateConfig"),
+    ("AerUnitaryConfig", _BACKEND_CONFIG, "AerUnitaryConfig"),
+    ("BraketConfig", _BACKEND_CONFIG, "BraketConfig"),
+    ("QuantinuumConfig", _BACKEND_CONFIG, "QuantinuumConfig"),
+    ("IBMQConfig", _BACKEND_CONFIG, "IBMQConfig"),
+    ("IBMQEmulatorConfig", _BACKEND_CONFIG, "IBMQEmulatorConfig"),
+    ("QulacsConfig", _BACKEND_CONFIG, "QulacsConfig"),
+    ("SeleneConfig", _BACKEND_CONFIG, "SeleneConfig"),
+    ("SelenePlusConfig", _BACKEND_CONFIG, "SelenePlusConfig"),
+    ("SimpleRuntime", _EMULATOR_CONFIG, "SimpleRuntime"),
+    ("HeliosConfig", _BACKEND_CONFIG, "HeliosConfig"),
+    ("HeliosEmulatorConfig", _BACKEND_CONFIG, "HeliosEmulatorConfig"),
+    ("HeliosRuntime", _EMULATOR_CONFIG, "HeliosRuntime"),
+    ("NoErrorModel", _EMULATOR_CONFIG, "NoErrorModel"),
+    ("DepolarizingErrorModel", _EMULATOR_CONFIG, "DepolarizingErrorModel"),
+    ("QSystemErrorModel", _EMULATOR_CONFIG, "QSystemErrorModel"),
+    ("StabilizerSimulator", _EMULATOR_CONFIG, "StabilizerSimulator"),
+    ("StatevectorSimulator", _EMULATOR_CONFIG, "StatevectorSimulator"),
+    ("CoinflipSimulator", _EMULATOR_CONFIG, "CoinflipSimulator"),
+    ("MatrixProductStateSimulator", _EMULATOR_CONFIG, "MatrixProductStateSimulator"),
+    ("ClassicalReplaySimulator", _EMULATOR_CONFIG, "ClassicalReplaySimulator"),
+    ("HeliosCustomErrorModel", _EMULATOR_CONFIG, "HeliosCustomErrorModel"),
+    ("HeliosErrorParams", _SYSTEMS_NOISE, "HeliosErrorParams"),
+    ("UserErrorParams", _SYSTEMS_NOISE, "UserErrorParams"),
 )
 
-__all__ = [
-    "AerConfig",
-    "AerStateConfig",
-    "AerUnitaryConfig",
-    "BraketConfig",
-    "QuantinuumConfig",
-    "IBMQConfig",
-    "IBMQEmulatorConfig",
-    "QulacsConfig",
-    "SeleneConfig",
-    "SelenePlusConfig",
-    "SimpleRuntime",
-    "HeliosConfig",
-    "HeliosEmulatorConfig",
-    "HeliosRuntime",
-    "NoErrorModel",
-    "DepolarizingErrorModel",
-    "QSystemErrorModel",
-    "StabilizerSimulator",
-    "StatevectorSimulator",
-    "CoinflipSimulator",
-    "MatrixProductStateSimulator",
-    "ClassicalReplaySimulator",
-    "HeliosCustomErrorModel",
-    "HeliosErrorParams",
-    "UserErrorParams",
-]
+__all__ = [name for name, _, _ in _EXPORTS]  # pyright: ignore[reportUnsupportedDunderAll]
+
+_LAZY_MAP: dict[str, tuple[str, str]] = {
+    name: (module, attr) for name, module, attr in _EXPORTS
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported models on first access and cache them on the module."""
+    try:
+        module_name, attr = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
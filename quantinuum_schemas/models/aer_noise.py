@@ -2,15 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, List, Literal, Optional, Tuple, Union
-from uuid import UUID, uuid4
-
-from pydantic import Field, field_validator
+import base64
+import os
+import re
+import sys
+import threading
+from array import array
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional, Tuple, Union
+from uuid import UUID
+
+from pydantic import AfterValidator, Field, PositiveInt, TypeAdapter, field_validator
+from pydantic.json_schema import WithJsonSchema
 
 from quantinuum_schemas.models.backend_info import Register
 
 from .base import BaseModel
 
+# A v4 UUID in (lowercase) hex format, as returned by UUID.hex.
+_UUID4_HEX_RE = re.compile(r"[0-9a-f]{12}4[0-9a-f]{3}[89ab][0-9a-f]{15}")
+
+# Number of v4 UUIDs generated from each os.urandom call.
+_UUID_BATCH_SIZE = 256
+_uuid_lock = threading.Lock()
+_uuid_pool: List[str] = []
+
+
+def _uuid4_hex() -> str:
+    """Return a random v4 UUID in hex format, drawn from a pre-generated batch."""
+    with _uuid_lock:
+        if not _uuid_pool:
+            raw = bytearray(os.urandom(16 * _UUID_BATCH_SIZE))
+            # Set the version (4) and variant (RFC 4122) bits of every UUID.
+            raw[6::16] = bytes((b & 0x0F) | 0x40 for b in raw[6::16])
+            raw[8::16] = bytes((b & 0x3F) | 0x80 for b in raw[8::16])
+            _uuid_pool.extend(raw[i : i + 16].hex() for i in range(0, len(raw), 16))
+        return _uuid_pool.pop()
+
+
+def _reset_uuid_pool() -> None:
+    """Discard the pool in a forked child, so it can't reuse the parent's UUIDs."""
+    global _uuid_lock  # pylint: disable=global-statement
+    _uuid_lock = threading.Lock()
+    _uuid_pool.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
 
 class QiskitBasicInstruction(BaseModel):
     """Validation model for qiskit instructions without params."""
@@ -27,14 +65,84 @@ class QiskitPauliInstruction(BaseModel):
     qubits: List[int]
 
 
+class PackedKrausParams(BaseModel):
+    """Kraus operator params packed into a contiguous block of float64s.
+
+    Args:
+        shape: Shape of the nested params list: (operators, rows, columns, 2),
+          where the last axis holds the real and imaginary parts.
+        data: Base64 encoding of the params as little-endian float64s, in row-major order.
+    """
+
+    shape: Tuple[PositiveInt, PositiveInt, PositiveInt, Literal[2]]
+    data: str
+
+
+def _unpack_kraus_params(packed: PackedKrausParams) -> List[List[List[List[float]]]]:
+    """Convert packed Kraus params back into nested lists."""
+    n_ops, n_rows, n_cols, n_parts = packed.shape
+    floats = array("d", base64.b64decode(packed.data))
+    if sys.byteorder == "big":
+        floats.byteswap()
+    if len(floats) != n_ops * n_rows * n_cols * n_parts:
+        raise ValueError(f"packed kraus params do not have shape {packed.shape}")
+    values = floats.tolist()
+    row_size = n_cols * n_parts
+    matrix_size = n_rows * row_size
+    return [
+        [
+            [
+                values[start : start + n_parts]
+                for start in range(row_start, row_start + row_size, n_parts)
+            ]
+            for row_start in range(op_start, op_start + matrix_size, row_size)
+        ]
+        for op_start in range(0, n_ops * matrix_size, matrix_size)
+    ]
+
+
+if TYPE_CHECKING:
+    KrausParams = List[List[List[List[float]]]]
+else:
+    # Nested lists are tried first, so only packed params pay for unpacking.
+    # Packing is an internal transport format, so the JSON schema only shows the lists.
+    KrausParams = Annotated[
+        Union[
+            List[List[List[List[float]]]],
+            Annotated[PackedKrausParams, AfterValidator(_unpack_kraus_params)],
+        ],
+        Field(union_mode="left_to_right"),
+        WithJsonSchema(
+            TypeAdapter(List[List[List[List[float]]]]).json_schema(),
+        ),
+    ]
+
+
 class QiskitKrausInstruction(BaseModel):
     """Validation model for qiskit kraus operator instructions."""
 
     name: Literal["kraus"] = "kraus"
-    # List of matrices of complex numbers
-    params: List[List[List[List[float]]]]
+    # List of matrices of complex numbers. May also be given as a PackedKrausParams,
+    # which is unpacked to the nested lists on validation (see pack_params).
+    params: KrausParams
     qubits: List[int]
 
+    def pack_params(self) -> PackedKrausParams:
+        """Pack the params into a contiguous block of float64s."""
+        n_rows = len(self.params[0]) if self.params else 0
+        n_cols = len(self.params[0][0]) if n_rows else 0
+        if not n_cols:
+            raise ValueError("Only non-empty kraus params can be packed")
+        floats = array(
+            "d", (x for matrix in self.params for row in matrix for c in row for x in c)
+        )
+        if sys.byteorder == "big":
+            floats.byteswap()
+        return PackedKrausParams(
+            shape=(len(self.params), n_rows, n_cols, 2),
+            data=base64.b64encode(floats.tobytes()).decode(),
+        )
+
 
 QiskitInstruction = Annotated[
     Union[
@@ -50,8 +158,8 @@ class AerQuantumError(BaseModel):
     """Validation model for qiskit-aer's QuantumError class."""
 
     type: Literal["qerror"] = "qerror"
-    id: str = Field(default_factory=lambda: uuid4().hex)
-    operations: Optional[List[str]] = Field(default_factory=lambda: [])
+    id: str = Field(default_factory=_uuid4_hex)
+    operations: Optional[List[str]] = Field(default_factory=list)
     instructions: List[List[QiskitInstruction]]
     probabilities: List[float] = Field(min_length=1)
     gate_qubits: List[List[int]]
@@ -59,6 +167,8 @@ class AerQuantumError(BaseModel):
     @field_validator("id")
     def validate_id(cls, value: Any) -> str:  # pylint: disable=no-self-argument
         """Ensure id is a v4 UUID in hex format."""
+        if isinstance(value, str) and _UUID4_HEX_RE.fullmatch(value):
+            return value
         return UUID(value, version=4).hex
 
 
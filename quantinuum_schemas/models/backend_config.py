@@ -6,26 +6,50 @@ as our backend credential classes handle those.
 """
 
 # pylint: disable=too-many-lines,no-member
+from __future__ import annotations
+
 import abc
+import importlib
+import math
+import threading
+from enum import Enum
+from itertools import repeat
+from types import MappingProxyType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Dict,
+    List,
     Literal,
+    Mapping,
     Optional,
     Protocol,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
+    get_args,
 )
 from uuid import UUID
 import warnings
 
-from pydantic import ConfigDict, PositiveInt, field_validator, model_validator
+import orjson
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import (
+    ConfigDict,
+    PlainValidator,
+    PositiveInt,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 from pydantic.fields import Field
+from pydantic.json_schema import WithJsonSchema
 from typing_extensions import Annotated, Self
 
-from quantinuum_schemas.models.aer_noise import AerNoiseModel, CrosstalkParams
 from quantinuum_schemas.models.emulator_config import (
     ClassicalReplaySimulator,
     CoinflipSimulator,
@@ -41,12 +65,59 @@ from quantinuum_schemas.models.emulator_config import (
 )
 from quantinuum_schemas.models.quantinuum_systems_noise import UserErrorParams
 
-from .base import BaseModel
+from .base import BaseModel, construct_trusted
+from .lazy_import import LazyModel
+
+_AER_NOISE = "quantinuum_schemas.models.aer_noise"
+
+if TYPE_CHECKING:
+    from quantinuum_schemas.models.aer_noise import AerNoiseModel, CrosstalkParams
+
+    _AerNoiseModel = AerNoiseModel
+    _CrosstalkParams = CrosstalkParams
+else:
+    # Only needed by AerConfig, so imported when its (deferred) schema is built.
+    # pylint: disable=invalid-name
+    _AerNoiseModel = LazyModel(_AER_NOISE, "AerNoiseModel")
+    _CrosstalkParams = LazyModel(_AER_NOISE, "CrosstalkParams")
+
+
+def __getattr__(name: str) -> Any:
+    """Keep the Aer noise models importable from here, loading them on first access."""
+    if name in ("AerNoiseModel", "CrosstalkParams"):
+        return getattr(importlib.import_module(_AER_NOISE), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ST = TypeVar("ST", bound="BaseModel")
 
 KNOWN_NEXUS_HELIOS_EMULATORS = ["Helios-1E-lite"]
 
+# Fields of BraketConfig that must all be set for a remote device, and unset for a local one.
+_BRAKET_REMOTE_FIELDS = ("device_type", "provider", "device", "s3_bucket", "s3_folder")
+
+
+def _require_floats(value: Any) -> List[float]:
+    """Check a list holds only floats, without the int coercion pydantic would apply."""
+    if not isinstance(value, list) or not all(map(isinstance, value, repeat(float))):
+        raise ValueError("Lists must only contain floats")
+    return value
+
+
+# Types accepted as values of QuantinuumOptions. Lists are checked by one call,
+# rather than validating (and copying) them entry by entry.
+OptionValue = Union[
+    str,
+    int,
+    bool,
+    float,
+    Annotated[
+        List[float],
+        PlainValidator(_require_floats),
+        WithJsonSchema({"items": {"type": "number"}, "type": "array"}),
+    ],
+]
+
 
 class BaseBackendConfig(BaseModel, abc.ABC):
     """Base class for all the backend configs.
@@ -54,25 +125,133 @@ class BaseBackendConfig(BaseModel, abc.ABC):
     for backwards compatibility.
     """
 
-    model_config = ConfigDict(frozen=True, extra="ignore")
+    # Schemas of the configs are built on first use rather than at import,
+    # as most processes only ever use a few of them.
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
+
+    # Every subclass, keyed by class name. Populated as the subclasses are defined.
+    # The first class defined under a name keeps it, so a subclass reusing the
+    # name (e.g. a downstream ``class AerConfig(AerConfig)``) can't replace it.
+    _registry: ClassVar[Dict[str, Type[BaseBackendConfig]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        BaseBackendConfig._registry.setdefault(cls.__name__, cls)
 
     def to_serializable(self) -> Dict[str, Any]:
         """Obtain orjson serializable form of the model."""
         return self.model_dump(exclude_none=True)
 
     @classmethod
-    def from_serializable(cls: Type[ST], jsonable: Dict[str, Any]) -> ST:
-        """Construct the class from a dict and perform validation."""
+    def from_serializable(
+        cls: Type[ST], jsonable: Dict[str, Any], cache: bool = False
+    ) -> ST:
+        """Construct the class from a dict and perform validation.
+
+        If cache is True, a config that can be shared, i.e. one holding just
+        frozen models and immutable values, is kept and returned again for later
+        payloads with the same JSON form; other configs (e.g. any with an
+        emulator model or a list) are validated afresh each time, so callers
+        never share mutable state. Where the cached path differs:
+        payloads are matched by their canonical JSON, so the first payload seen
+        decides the instance returned for equivalent ones (e.g. a tuple stands
+        in for an equal list, a UUID for its string), and validation warnings
+        are only emitted for that first payload. Payloads JSON can't represent
+        faithfully, e.g. holding NaN or a qiskit NoiseModel, are never cached.
+        Called on BaseBackendConfig, the config class is chosen by jsonable["type"].
+        """
+        if cls is BaseBackendConfig:
+            type_ = jsonable.get("type")
+            if cache and isinstance(type_, str) and type_ in _DISCRIMINATOR_MAP:
+                config_cls = _DISCRIMINATOR_MAP[type_]
+                return cast(ST, config_cls.from_serializable(jsonable, cache=True))
+            return cast(ST, decode_backend_config(jsonable))
+        if cache:
+            key = _cache_key(jsonable)
+            if key is not None:
+                shared = _shared_configs.get((cls, key))
+                if shared is not None:
+                    return cast(ST, shared)
+                config = cls(**jsonable)
+                if _is_immutable(config):
+                    _share_config((cls, key), config)
+                return config
         return cls(**jsonable)
 
+    @classmethod
+    def from_trusted(cls: Type[ST], data: Dict[str, Any]) -> ST:
+        """Construct a config from already validated data, skipping validation.
+
+        Warning: performs no validation at all, so must never be used on user input.
+        Intended for data produced by this package, e.g. by to_serializable().
+        Called on BaseBackendConfig, the config class is chosen by data["type"].
+        """
+        config_cls = cls
+        if cls is BaseBackendConfig:
+            config_cls = cast(Type[ST], _DISCRIMINATOR_MAP[data["type"]])
+        return construct_trusted(config_cls, data)
+
+
+# Configs returned by from_serializable(cache=True), keyed by class and canonical
+# JSON payload. Only deeply immutable configs are kept, oldest first.
+_shared_configs: Dict[Tuple[type, bytes], BaseModel] = {}
+_SHARED_CONFIGS_MAXSIZE = 256
+_shared_configs_lock = threading.Lock()
+
+
+def _cache_key(jsonable: Dict[str, Any]) -> Optional[bytes]:
+    """Canonical JSON of a payload, or None if JSON can't represent it faithfully."""
+    try:
+        key = orjson.dumps(jsonable, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # Not JSON serializable (e.g. a qiskit NoiseModel).
+        return None
+    # orjson writes NaN and infinities as null, so a null may stand for either.
+    if b"null" in key and not _is_finite(jsonable):
+        return None
+    return key
+
+
+def _is_finite(value: Any) -> bool:
+    """Check that no float in a payload is NaN or infinite."""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return all(map(_is_finite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return all(map(_is_finite, value))
+    return True
+
+
+def _share_config(key: Tuple[type, bytes], config: BaseModel) -> None:
+    """Keep a config for from_serializable(cache=True), evicting the oldest if full."""
+    with _shared_configs_lock:
+        if len(_shared_configs) >= _SHARED_CONFIGS_MAXSIZE:
+            del _shared_configs[next(iter(_shared_configs))]
+        _shared_configs[key] = config
+
+
+def _is_immutable(value: Any) -> bool:
+    """Check that value, and everything it holds, can't be changed in place."""
+    if isinstance(value, PydanticBaseModel):
+        if not type(value).model_config.get("frozen", False):
+            return False
+        fields = [getattr(value, name) for name in type(value).model_fields]
+        extra = value.__pydantic_extra__ or {}
+        return all(_is_immutable(item) for item in (*fields, *extra.values()))
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in value)
+    return isinstance(value, (str, bytes, int, float, type(None), UUID, Enum))
+
 
 class AerConfig(BaseBackendConfig):
     """Qiskit Aer QASM simulator."""
 
     type: Literal["AerConfig"] = "AerConfig"
-    noise_model: Optional[AerNoiseModel] = None
+    noise_model: Optional[_AerNoiseModel] = None
     simulation_method: str = "automatic"
-    crosstalk_params: Optional[CrosstalkParams] = None
+    crosstalk_params: Optional[_CrosstalkParams] = None
     n_qubits: PositiveInt = 40
     seed: Optional[int] = None
 
@@ -81,22 +260,25 @@ class AerConfig(BaseBackendConfig):
     def validate_noise_model(
         cls,
         value: Any,
-    ) -> Optional[AerNoiseModel]:
-        """Validate that we can use this"""
-        if value is not None:
-            if isinstance(value, AerNoiseModel):
-                return value
-            if hasattr(value, "to_dict"):
-                # Should cover the case of an Aer NoiseModel being passed directly.
-                # Needs to be passed serializable=True to prevent numpy
-                # arrays being included in the dictionary.
-                return AerNoiseModel(**value.to_dict(serializable=True))
-            if isinstance(value, dict):
-                return AerNoiseModel(**value)
-            raise ValueError(
-                "must be an AerNoiseModel, a qiskit-aer NoiseModel or conform to the spec."
-            )
-        return None
+    ) -> Any:
+        """Validate that we can use this
+
+        Dicts are returned as they are, to be validated by the field's own schema.
+        """
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        from quantinuum_schemas.models.aer_noise import AerNoiseModel
+
+        # Checked in order of how common each input is, most common first.
+        if value is None or isinstance(value, (dict, AerNoiseModel)):
+            return value
+        if hasattr(value, "to_dict"):
+            # Should cover the case of an Aer NoiseModel being passed directly.
+            # Needs to be passed serializable=True to prevent numpy
+            # arrays being included in the dictionary.
+            return value.to_dict(serializable=True)
+        raise ValueError(
+            "must be an AerNoiseModel, a qiskit-aer NoiseModel or conform to the spec."
+        )
 
 
 class AerStateConfig(BaseBackendConfig):
@@ -129,51 +311,29 @@ class BraketConfig(BaseBackendConfig):
     # Parameters below are kwargs used in BraketBackend.process_circuits().
     simplify_initial: bool = False
 
-    @model_validator(mode="before")
-    def check_local_remote_parameters_are_consistent(  # pylint: disable=no-self-argument,
-        cls, values: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    @model_validator(mode="after")
+    def check_local_remote_parameters_are_consistent(self) -> Self:
         """Validate that the parameters for BraketConfig are consistent for either a local device,
         or a remote device."""
-        if values.get("local"):
+        if self.local:
             # For a local config, we care about local_device only. This has a default value,
             # so we don't need to validate it, but we should give a ValidationError if any of
             # the other items are set.
-            if any(
-                (
-                    values.get(remote_field) is not None
-                    for remote_field in (
-                        "device_type",
-                        "provider",
-                        "device",
-                        "s3_bucket",
-                        "s3_folder",
+            for remote_field in _BRAKET_REMOTE_FIELDS:
+                if getattr(self, remote_field) is not None:
+                    raise ValueError(
+                        "BraketConfig with local=True must only have local and local_device set"
                     )
-                )
-            ):
-                raise ValueError(
-                    "BraketConfig with local=True must only have local and local_device set"
-                )
         else:
             # We can ignore local_device, because it has a default value in BraketBackend,
             # but all of the other parameters must be set.
-            if any(
-                (
-                    values.get(remote_field) is None
-                    for remote_field in (
-                        "device_type",
-                        "provider",
-                        "device",
-                        "s3_bucket",
-                        "s3_folder",
+            for remote_field in _BRAKET_REMOTE_FIELDS:
+                if getattr(self, remote_field) is None:
+                    raise ValueError(
+                        "BraketConfig with local=False must have device_type, provider, "
+                        "device, s3_bucket and s3_folder set"
                     )
-                )
-            ):
-                raise ValueError(
-                    "BraketConfig with local=False must have device_type, provider, device, "
-                    "s3_bucket and s3_folder set"
-                )
-        return values
+        return self
 
 
 class QuantinuumOptions(BaseModel):
@@ -182,21 +342,10 @@ class QuantinuumOptions(BaseModel):
     Intentionally allows extra unknown flags to be defined.
     """
 
-    model_config = ConfigDict(extra="allow", frozen=True)
+    model_config = ConfigDict(extra="allow", frozen=True, defer_build=True)
 
-    @model_validator(mode="before")
-    def check_field_values_are_supported_types(  # pylint: disable=no-self-argument,
-        cls, values: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Check that option values are supported types."""
-        for key in values:
-            assert isinstance(values[key], (str, int, bool, float, list)), (
-                "Options must be str, bool int, float or a list of floats"
-            )
-            if isinstance(values[key], list):
-                for x in values[key]:
-                    assert isinstance(x, float), "Lists must only contain floats"
-        return values
+    # Option values must be str, bool, int, float or a list of floats.
+    __pydantic_extra__: Dict[str, OptionValue] = Field(init=False)  # pyright: ignore[reportIncompatibleVariableOverride]
 
 
 # Alias via inheritance for backwards compatibility
@@ -374,6 +523,24 @@ class QulacsConfig(BaseBackendConfig):
     seed: Optional[int] = None
 
 
+# Simulators and error models available to the Selene Plus and Helios emulators.
+# Plain aliases, so the configs share the definitions only: pydantic still builds
+# each field's union validator separately.
+SelenePlusSimulator = Union[
+    StatevectorSimulator,
+    StabilizerSimulator,
+    MatrixProductStateSimulator,
+    CoinflipSimulator,
+    ClassicalReplaySimulator,
+]
+SelenePlusErrorModel = Union[
+    NoErrorModel,
+    DepolarizingErrorModel,
+    QSystemErrorModel,
+    HeliosCustomErrorModel,
+]
+
+
 class BaseEmulatorConfig(BaseModel):
     """Shared configuration for Selene emulator instances. Not to be used directly.
 
@@ -382,6 +549,8 @@ class BaseEmulatorConfig(BaseModel):
           Specify in the job submission parameters per-job item instead.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     n_qubits: int | None = None
 
     @model_validator(mode="after")
@@ -447,20 +616,9 @@ class SelenePlusConfig(BaseEmulatorConfig, BaseBackendConfig):
 
     type: Literal["SelenePlusConfig"] = "SelenePlusConfig"
 
-    simulator: (
-        StatevectorSimulator
-        | StabilizerSimulator
-        | MatrixProductStateSimulator
-        | CoinflipSimulator
-        | ClassicalReplaySimulator
-    ) = Field(default_factory=StatevectorSimulator)
+    simulator: SelenePlusSimulator = Field(default_factory=StatevectorSimulator)
     runtime: SimpleRuntime | HeliosRuntime = Field(default_factory=HeliosRuntime)
-    error_model: (
-        NoErrorModel
-        | DepolarizingErrorModel
-        | QSystemErrorModel
-        | HeliosCustomErrorModel
-    ) = Field(default_factory=QSystemErrorModel)
+    error_model: SelenePlusErrorModel = Field(default_factory=QSystemErrorModel)
 
     @model_validator(mode="after")
     def validate_runtime_and_error_model(self) -> Self:
@@ -493,21 +651,8 @@ class HeliosEmulatorConfig(BaseEmulatorConfig):
           Specify in the job submission parameters per-job item instead.
     """
 
-    n_qubits: int | None = None
-
-    simulator: (
-        StatevectorSimulator
-        | StabilizerSimulator
-        | MatrixProductStateSimulator
-        | CoinflipSimulator
-        | ClassicalReplaySimulator
-    ) = Field(default_factory=StatevectorSimulator)
-    error_model: (
-        NoErrorModel
-        | DepolarizingErrorModel
-        | QSystemErrorModel
-        | HeliosCustomErrorModel
-    ) = Field(default_factory=QSystemErrorModel)
+    simulator: SelenePlusSimulator = Field(default_factory=StatevectorSimulator)
+    error_model: SelenePlusErrorModel = Field(default_factory=QSystemErrorModel)
     runtime: HeliosRuntime = Field(default_factory=HeliosRuntime)
 
 
@@ -591,7 +736,69 @@ BackendConfig = Annotated[
     Field(discriminator="type"),
 ]
 
-config_name_to_class: Dict[str, BackendConfig] = {
-    config_type.__name__: config_type  # type: ignore
-    for config_type in BaseBackendConfig.__subclasses__()
-}
+# Read-only view of the registry, so configs defined later are also included.
+config_name_to_class: Mapping[str, Type[BaseBackendConfig]] = MappingProxyType(
+    BaseBackendConfig._registry  # pylint: disable=protected-access
+)
+
+# Each member of BackendConfig keyed by the default of its type field.
+_DISCRIMINATOR_MAP: Mapping[str, Type[BaseBackendConfig]] = MappingProxyType(
+    {
+        config_cls.model_fields["type"].default: config_cls
+        for config_cls in get_args(get_args(BackendConfig)[0])
+    }
+)
+
+# Validates any backend config, dispatching on its type. Built on first use, then reused.
+BACKEND_CONFIG_ADAPTER: TypeAdapter[BackendConfig] = TypeAdapter(
+    BackendConfig, config=ConfigDict(defer_build=True)
+)
+
+# As above, for validating many configs at once, e.g. from a JSON array of saved jobs.
+BACKEND_CONFIG_LIST_ADAPTER: TypeAdapter[List[BackendConfig]] = TypeAdapter(
+    List[BackendConfig], config=ConfigDict(defer_build=True)
+)
+
+
+def parse_backend_config(jsonable: Dict[str, Any]) -> BackendConfig:
+    """Validate a dict as whichever backend config its type field names."""
+    return BACKEND_CONFIG_ADAPTER.validate_python(jsonable)
+
+
+def build_schemas() -> None:
+    """Build the deferred validators and serializers of every backend config now.
+
+    Schemas are otherwise built on first use. Long-running workers can call this
+    once at start-up (e.g. before forking) to keep that cost off the first request.
+    """
+    for config_cls in config_name_to_class.values():
+        config_cls.model_rebuild()
+    BACKEND_CONFIG_ADAPTER.rebuild()
+    BACKEND_CONFIG_LIST_ADAPTER.rebuild()
+
+
+def decode_backend_config(jsonable: Dict[str, Any]) -> BackendConfig:
+    """Validate a dict as the backend config its type field names.
+
+    Looks the class up directly and validates against it alone, rather than
+    going through the discriminated union. Dicts with a missing, unknown or
+    non-string type are passed to the union, so the usual ValidationError is raised.
+    """
+    type_ = jsonable.get("type")
+    config_cls = _DISCRIMINATOR_MAP.get(type_) if isinstance(type_, str) else None
+    if config_cls is None:
+        return BACKEND_CONFIG_ADAPTER.validate_python(jsonable)
+    return cast(BackendConfig, config_cls.model_validate(jsonable))
+
+
+def dump_backend_config(config: BackendConfig) -> Dict[str, Any]:
+    """Dump any backend config to a dict, omitting unset (None) fields."""
+    dumped: Dict[str, Any] = BACKEND_CONFIG_ADAPTER.dump_python(
+        config, exclude_none=True
+    )
+    return dumped
+
+
+def parse_backend_configs_json(raw: bytes | str) -> List[BackendConfig]:
+    """Parse and validate a JSON array of backend configs in a single pass."""
+    return BACKEND_CONFIG_LIST_ADAPTER.validate_json(raw)
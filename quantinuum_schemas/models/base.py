@@ -1,10 +1,27 @@
 """Base model definition for use in other models."""
 
-from typing import TYPE_CHECKING, Dict, List, Union
+from collections.abc import Mapping
+from enum import Enum
+from functools import cache
+from types import UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, Field
-from typing_extensions import Annotated
+from typing_extensions import Annotated, get_args, get_origin
+
+from .lazy_import import LazyModel
+
+MT = TypeVar("MT", bound=PydanticBaseModel)
 
 
 class BaseModel(PydanticBaseModel):
@@ -12,6 +29,205 @@ class BaseModel(PydanticBaseModel):
 
     model_config = ConfigDict(use_enum_values=True, extra="ignore")
 
+    def to_json(self) -> bytes:
+        """Serialize the model directly to JSON bytes, omitting unset (None) fields.
+
+        Avoids building the intermediate dict that orjson.dumps(model_dump()) would.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+    @classmethod
+    def from_json(cls: type[MT], raw: bytes | str) -> MT:
+        """Construct the model from JSON, parsing and validating in one pass."""
+        return cls.model_validate_json(raw)
+
+    @classmethod
+    def from_trusted(cls: type[MT], data: dict[str, Any]) -> MT:
+        """Construct the model from already validated data, skipping validation.
+
+        Warning: performs no validation at all, so must never be used on user input.
+        See construct_trusted.
+        """
+        return construct_trusted(cls, data)
+
+
+def construct_trusted(cls: type[MT], data: dict[str, Any]) -> MT:
+    """Construct a model, and any nested models, without validation.
+
+    Only for data that has already been validated, such as the output of
+    model_dump(), or of to_json() loaded back with orjson.loads(). Values JSON
+    can't represent are converted back following the field annotations: UUIDs
+    from strings, tuples from lists and, unless the model stores enum values,
+    enums from their values. Nested models in a union are matched by their
+    Literal fields, e.g. `type`. No validators are run, so no checks are made
+    and no warnings are emitted.
+    """
+    use_enum_values = cls.model_config.get("use_enum_values", False)
+    annotations = _constructed_field_annotations(cls)
+    values = {}
+    for name, value in data.items():
+        annotation = annotations.get(name)
+        if annotation is not None:
+            value = _construct_value(annotation, value, use_enum_values)
+        values[name] = value
+    return cls.model_construct(**values)
+
+
+# Per model: its fields, and the annotations of those construct_trusted may rebuild.
+_constructed_fields: dict[type, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+
+def _constructed_field_annotations(cls: type[PydanticBaseModel]) -> dict[str, Any]:
+    """Annotations of the fields of a model whose values may need rebuilding.
+
+    Recomputed if the model's fields change, e.g. when a forward reference resolves.
+    """
+    fields = cls.model_fields
+    cached = _constructed_fields.get(cls)
+    if cached is None or cached[0] is not fields:
+        annotations = {}
+        for name, field in fields.items():
+            annotation: Any = field.annotation
+            if _needs_construct(annotation):
+                annotations[name] = annotation
+        cached = _constructed_fields[cls] = (fields, annotations)
+    return cached[1]
+
+
+def _construct_value(annotation: Any, value: Any, use_enum_values: bool) -> Any:
+    """Rebuild any models, tuples, UUIDs and enums in a dumped value, following its annotation."""
+    if isinstance(value, dict):
+        return _construct_dict(annotation, value, use_enum_values)
+    if isinstance(value, list):
+        return _construct_list(annotation, value, use_enum_values)
+    if isinstance(value, (str, int)):
+        members = _union_members(annotation)
+        if type(value) not in members:
+            for arg in members:
+                if arg is UUID and isinstance(value, str):
+                    return UUID(value)
+                if isinstance(arg, type) and issubclass(arg, Enum):
+                    return value if use_enum_values else arg(value)
+    return value
+
+
+def _construct_dict(
+    annotation: Any, value: dict[str, Any], use_enum_values: bool
+) -> Any:
+    """Rebuild a dumped model, or the values of a mapping, e.g. Dict[str, X]."""
+    nested_cls = _nested_model_class(annotation, value)
+    if nested_cls is not None:
+        return construct_trusted(nested_cls, value)
+    for arg in _union_members(annotation):
+        if get_origin(arg) in (dict, Mapping):
+            args = get_args(arg)
+            value_annotation = args[1] if len(args) == 2 else Any
+            if _needs_construct(value_annotation):
+                return {
+                    key: _construct_value(value_annotation, item, use_enum_values)
+                    for key, item in value.items()
+                }
+            break
+    return value
+
+
+def _construct_list(annotation: Any, value: list[Any], use_enum_values: bool) -> Any:
+    """Rebuild a dumped tuple, or the items of a list, e.g. List[X]."""
+    for arg in _union_members(annotation):
+        if get_origin(arg) is tuple:
+            return _construct_tuple(arg, value, use_enum_values)
+        if get_origin(arg) is list:
+            (item_annotation,) = get_args(arg) or (Any,)
+            if _needs_construct(item_annotation):
+                return [
+                    _construct_value(item_annotation, item, use_enum_values)
+                    for item in value
+                ]
+            break
+    return value
+
+
+def _construct_tuple(annotation: Any, value: list[Any], use_enum_values: bool) -> Any:
+    """Rebuild a tuple dumped to JSON as a list, e.g. Tuple[float, float] or Tuple[int, ...]."""
+    item_annotations = get_args(annotation)
+    if len(item_annotations) == 2 and item_annotations[1] is Ellipsis:
+        item_annotations = (item_annotations[0],) * len(value)
+    return tuple(
+        _construct_value(item_annotation, item, use_enum_values)
+        for item_annotation, item in zip(item_annotations, value)
+    )
+
+
+@cache
+def _union_members(annotation: Any) -> tuple[Any, ...]:
+    """Expand the unions, Annotated and NewTypes in an annotation, in order."""
+    members = []
+    pending = [annotation]
+    while pending:
+        arg = pending.pop()
+        if hasattr(arg, "__supertype__"):
+            pending.append(arg.__supertype__)
+        elif get_origin(arg) in (Union, UnionType):
+            pending.extend(reversed(get_args(arg)))
+        elif get_origin(arg) is Annotated:
+            pending.append(get_args(arg)[0])
+        else:
+            members.append(arg)
+    return tuple(members)
+
+
+@cache
+def _needs_construct(annotation: Any) -> bool:
+    """Check whether values of an annotation may hold anything _construct_value rebuilds."""
+    pending = [annotation]
+    while pending:
+        arg = pending.pop()
+        if isinstance(arg, LazyModel) or get_origin(arg) is tuple:
+            return True
+        if isinstance(arg, type) and issubclass(arg, (PydanticBaseModel, UUID, Enum)):
+            return True
+        if hasattr(arg, "__supertype__"):
+            pending.append(arg.__supertype__)
+        else:
+            pending.extend(get_args(arg))
+    return False
+
+
+@cache
+def _model_candidates(annotation: Any) -> tuple[type[PydanticBaseModel], ...]:
+    """Find the models a field annotation may directly hold, e.g. X in Optional[X].
+
+    Models inside containers, e.g. Dict[str, X], are not included.
+    """
+    candidates = []
+    for arg in _union_members(annotation):
+        if isinstance(arg, LazyModel):
+            arg = arg.load()
+        if isinstance(arg, type) and issubclass(arg, PydanticBaseModel):
+            candidates.append(arg)
+    return tuple(candidates)
+
+
+def _nested_model_class(
+    annotation: Any, value: dict[str, Any]
+) -> type[PydanticBaseModel] | None:
+    """Find the model in a field annotation that a dict value should be constructed as."""
+    candidates = _model_candidates(annotation)
+    if len(candidates) == 1:
+        return candidates[0]
+    matching = [
+        candidate
+        for candidate in candidates
+        if all(
+            value.get(name) in get_args(field.annotation)
+            for name, field in candidate.model_fields.items()
+            if get_origin(field.annotation) is Literal
+        )
+    ]
+    if len(matching) == 1:
+        return matching[0]
+    return None
+
 
 if TYPE_CHECKING:
     Int64 = int
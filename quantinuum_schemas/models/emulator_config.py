@@ -164,7 +164,7 @@ class MatrixProductStateSimulator(BaseModel):
         """Validate the configuration for the emulator."""
         if self.backend == "cpu" and self.chi is not None and self.chi > 256:
             raise ValueError("CPU backend does not support chi > 256.")
-        if self.chi and self.truncation_fidelity:
+        if self.chi is not None and self.truncation_fidelity is not None:
             raise ValueError("Cannot set both chi and truncation_fidelity.")
         if self.backend != "auto":
             raise ValueError("Only backend='auto' is supported at this time.")
@@ -0,0 +1,38 @@
+"""Helpers for referencing models whose modules are only imported when needed."""
+
+import importlib
+from typing import Any
+
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import CoreSchema
+
+
+class LazyModel:
+    """Stand-in for a model class that is imported the first time it is needed.
+
+    May be used in a field annotation in place of the model itself: the model's
+    module is only imported when Pydantic builds the schema of the enclosing
+    model, or when the stand-in is called to construct an instance.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+
+    def load(self) -> type[BaseModel]:
+        """Import and return the model class."""
+        model: type[BaseModel] = getattr(
+            importlib.import_module(self.module), self.name
+        )
+        return model
+
+    def __call__(self, *args: Any, **kwargs: Any) -> BaseModel:
+        return self.load()(*args, **kwargs)
+
+    def __get_pydantic_core_schema__(
+        self, _source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return handler.generate_schema(self.load())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.module!r}, {self.name!r})"
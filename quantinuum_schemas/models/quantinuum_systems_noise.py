@@ -1,9 +1,9 @@
 """Validation classes for Quantinuum Systems noise models."""
 
-from typing import Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Self
 
-from pydantic import AliasChoices, Field, model_validator
+from pydantic import AliasChoices, ConfigDict, Field, TypeAdapter, model_validator
 
 from .base import BaseModel
 
@@ -54,6 +54,8 @@ class HeliosErrorParams(BaseModel):
         p2_idle: Stochastic idle noise after each two-qubit gate.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     p_init: float | None = Field(
         default=None,
         ge=0.0,
@@ -126,11 +128,8 @@ class HeliosErrorParams(BaseModel):
     @model_validator(mode="after")
     def check_valid_config(self) -> Self:
         """Validate the error model configuration."""
-        przz_params = [self.przz_a, self.przz_b, self.przz_c, self.przz_d]
-        if not (
-            all(x is None for x in przz_params)
-            or all(x is not None for x in przz_params)
-        ):
+        przz_params = (self.przz_a, self.przz_b, self.przz_c, self.przz_d)
+        if przz_params.count(None) not in (0, 4):
             raise ValueError(
                 "When setting przz_x, you must either set the four of them, or none."
             )
@@ -195,10 +194,15 @@ class UserErrorParams(BaseModel):
 
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     # Physical Noise
     p1: Optional[float] = None
     p2: Optional[float] = None
-    p_meas: Optional[Union[float, Tuple[float, float]]] = None
+    # Tried in order: a float is by far the most common value.
+    p_meas: Optional[Union[float, Tuple[float, float]]] = Field(
+        default=None, union_mode="left_to_right"
+    )
     p_init: Optional[float] = None
     p_crosstalk_meas: Optional[float] = None
     p_crosstalk_init: Optional[float] = None
@@ -227,3 +231,16 @@ class UserErrorParams(BaseModel):
     emission_scale: Optional[float] = None
     crosstalk_scale: Optional[float] = None
     leakage_scale: Optional[float] = None
+
+
+# Validates many parameter sets in one call, e.g. for a sweep. Built on first use, then reused.
+HELIOS_ERROR_PARAMS_LIST_ADAPTER: TypeAdapter[List[HeliosErrorParams]] = TypeAdapter(
+    List[HeliosErrorParams], config=ConfigDict(defer_build=True)
+)
+
+
+def parse_helios_error_params(
+    jsonables: List[Dict[str, Any]],
+) -> List[HeliosErrorParams]:
+    """Validate a list of dicts as HeliosErrorParams in a single pass."""
+    return HELIOS_ERROR_PARAMS_LIST_ADAPTER.validate_python(jsonables)
@@ -6,7 +6,7 @@ Deprecated - please use HUGR's QSysResult instead.
 
 from typing import Annotated, TypeAlias
 
-from pydantic import StringConstraints
+from pydantic import ConfigDict, StringConstraints, TypeAdapter
 
 QShotValType: TypeAlias = int | bool | float
 QSysShotItemValue: TypeAlias = QShotValType | list[QShotValType]
@@ -16,3 +16,8 @@ QSysShotItem: TypeAlias = tuple[
 ]
 QSysShot: TypeAlias = list[QSysShotItem]
 QSysResult: TypeAlias = list[QSysShot]
+
+# Validates results directly, without a wrapper model. Built on first use, then reused.
+QSYS_RESULT_ADAPTER: TypeAdapter[QSysResult] = TypeAdapter(
+    QSysResult, config=ConfigDict(defer_build=True)
+)
@@ -0,0 +1,150 @@
+"""Test Aer noise models."""
+
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+from quantinuum_schemas.models.aer_noise import (
+    AerNoiseModel,
+    AerQuantumError,
+    AerReadoutError,
+    QiskitBasicInstruction,
+    QiskitInstruction,
+    QiskitKrausInstruction,
+    QiskitPauliInstruction,
+)
+
+# Kraus operators of an amplitude damping channel with gamma=0.36.
+KRAUS_PARAMS = [
+    [[[1.0, 0.0], [0.0, 0.0]], [[0.0, 0.0], [0.8, 0.0]]],
+    [[[0.0, 0.0], [0.6, 0.0]], [[0.0, 0.0], [0.0, 0.0]]],
+]
+
+
+def test_default_ids_are_unique_v4_uuids() -> None:
+    """Test the default AerQuantumError id is a distinct v4 UUID in hex format."""
+    ids = [
+        AerQuantumError(instructions=[[]], probabilities=[1.0], gate_qubits=[[0]]).id
+        for _ in range(300)
+    ]
+    assert len(set(ids)) == len(ids)
+    assert all(UUID(id_, version=4).hex == id_ for id_ in ids)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        uuid4().hex,
+        str(uuid4()),
+        uuid4().hex.upper(),
+        "0" * 32,
+    ],
+)
+def test_id_is_normalised_to_v4_hex(value: str) -> None:
+    """Test ids are validated and normalised to the same form as UUID(value, version=4).hex"""
+    error = AerQuantumError(
+        id=value, instructions=[[]], probabilities=[1.0], gate_qubits=[[0]]
+    )
+    assert error.id == UUID(value, version=4).hex
+
+
+def test_invalid_id() -> None:
+    """Test an id that isn't a UUID is rejected."""
+    with pytest.raises(ValueError):
+        AerQuantumError(
+            id="not-a-uuid", instructions=[[]], probabilities=[1.0], gate_qubits=[[0]]
+        )
+
+
+def test_packed_kraus_params_roundtrip() -> None:
+    """Test Kraus params can be packed and are unpacked on validation."""
+    instruction = QiskitKrausInstruction(params=KRAUS_PARAMS, qubits=[0])
+    packed = instruction.pack_params()
+    assert packed.shape == (2, 2, 2, 2)
+
+    unpacked = QiskitKrausInstruction.model_validate(
+        {"name": "kraus", "params": packed.model_dump(), "qubits": [0]}
+    )
+    assert unpacked == instruction
+    assert (
+        QiskitKrausInstruction.model_validate_json(
+            f'{{"params": {packed.model_dump_json()}, "qubits": [0]}}'
+        )
+        == instruction
+    )
+
+
+def test_packed_kraus_params_shape_mismatch() -> None:
+    """Test packed Kraus params are rejected unless the shape is valid and matches the data."""
+    packed = QiskitKrausInstruction(params=KRAUS_PARAMS, qubits=[0]).pack_params()
+    instruction = QiskitKrausInstruction.model_validate(
+        {"params": packed, "qubits": [0]}
+    )
+    assert instruction.params == KRAUS_PARAMS
+    for shape in [(1, 2, 2, 2), (2, 2, 4, 1), (0, 2, 2, 2), (-2, -2, 2, 2)]:
+        with pytest.raises(ValueError):
+            QiskitKrausInstruction.model_validate(
+                {"params": {"shape": shape, "data": packed.data}, "qubits": [0]}
+            )
+
+
+def test_packed_kraus_params_internal() -> None:
+    """Test the packed form stays out of the schema, and empty params can't be packed."""
+    params_schema = QiskitKrausInstruction.model_json_schema()["properties"]["params"]
+    assert params_schema == {
+        **TypeAdapter(list[list[list[list[float]]]]).json_schema(),
+        "title": "Params",
+    }
+    with pytest.raises(ValueError, match="non-empty"):
+        QiskitKrausInstruction(params=[], qubits=[0]).pack_params()
+
+
+@pytest.mark.parametrize(
+    "instruction,expected_class",
+    [
+        *(
+            ({"name": name}, QiskitBasicInstruction)
+            for name in ["id", "x", "y", "z", "reset"]
+        ),
+        ({"name": "pauli", "params": ["XY"]}, QiskitPauliInstruction),
+        ({"name": "kraus", "params": KRAUS_PARAMS}, QiskitKrausInstruction),
+    ],
+)
+def test_instruction_dispatch(
+    instruction: dict[str, object], expected_class: type
+) -> None:
+    """Test every instruction name is dispatched to its model by the discriminator."""
+    adapter: TypeAdapter[QiskitInstruction] = TypeAdapter(QiskitInstruction)
+    assert isinstance(
+        adapter.validate_python({**instruction, "qubits": [0]}), expected_class
+    )
+
+
+def test_noise_model_roundtrips() -> None:
+    """Test to_json and from_trusted rebuild models nested in lists and unions."""
+    noise_model = AerNoiseModel(
+        errors=[
+            AerQuantumError.model_validate(
+                {
+                    "instructions": [
+                        [{"name": "x", "qubits": [0]}],
+                        [{"name": "pauli", "params": ["XY"], "qubits": [0, 1]}],
+                        [{"name": "kraus", "params": KRAUS_PARAMS, "qubits": [0]}],
+                    ],
+                    "probabilities": [0.5, 0.25, 0.25],
+                    "gate_qubits": [[0]],
+                }
+            ),
+            AerReadoutError(probabilities=[[0.9, 0.1], [0.2, 0.8]], gate_qubits=[[0]]),
+        ]
+    )
+    assert AerNoiseModel.model_validate_json(noise_model.to_json()) == noise_model
+    rebuilt = AerNoiseModel.from_trusted(noise_model.model_dump())
+    assert rebuilt == noise_model
+    assert (
+        AerNoiseModel.from_trusted(orjson.loads(noise_model.to_json())) == noise_model
+    )
+    assert isinstance(rebuilt.errors[0], AerQuantumError)
+    assert isinstance(rebuilt.errors[0].instructions[1][0], QiskitPauliInstruction)
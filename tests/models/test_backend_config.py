@@ -1,19 +1,32 @@
 """Test backendconfig models."""
 
+import math
 from uuid import UUID, uuid4
 import warnings
 
+import orjson
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from quantinuum_schemas.models.backend_config import (
+    BACKEND_CONFIG_ADAPTER,
+    _DISCRIMINATOR_MAP,
+    _shared_configs,
     AerConfig,
+    BaseBackendConfig,
+    BraketConfig,
     HeliosConfig,
     HeliosEmulatorConfig,
     QuantinuumConfig,
     SeleneConfig,
     QuantinuumCompilerOptions,
     SelenePlusConfig,
+    build_schemas,
+    config_name_to_class,
+    decode_backend_config,
+    dump_backend_config,
+    parse_backend_config,
+    parse_backend_configs_json,
 )
 from quantinuum_schemas.models.emulator_config import (
     ClassicalReplaySimulator,
@@ -27,6 +40,7 @@ from quantinuum_schemas.models.emulator_config import (
     StabilizerSimulator,
     StatevectorSimulator,
 )
+from quantinuum_schemas.models.quantinuum_systems_noise import UserErrorParams
 
 
 def test_instantiation() -> None:
@@ -35,6 +49,256 @@ def test_instantiation() -> None:
     assert isinstance(aer_config, AerConfig)
 
 
+def test_to_json() -> None:
+    """Test to_json produces the JSON form of to_serializable."""
+    config = QuantinuumConfig(
+        device_name="H2-1", batch_id=uuid4(), attempt_batching=True
+    )
+    assert orjson.loads(config.to_json()) == orjson.loads(
+        orjson.dumps(config.to_serializable())
+    )
+
+
+def test_from_json() -> None:
+    """Test from_json roundtrips the output of to_json."""
+    config = HeliosConfig(
+        system_name="Helios-1E", emulator_config=HeliosEmulatorConfig()
+    )
+    assert HeliosConfig.from_json(config.to_json()) == config
+
+    aer_config = AerConfig(noise_model={"errors": []})  # type: ignore[arg-type]
+    assert AerConfig.from_json(aer_config.to_json()) == aer_config
+    assert aer_config.noise_model is not None
+
+
+def test_from_serializable_cache() -> None:
+    """Test cached deserialization returns the same instance for equal payloads."""
+    jsonable = QuantinuumConfig(
+        device_name="H2-1", batch_id=uuid4(), attempt_batching=True
+    ).to_serializable()
+
+    config = QuantinuumConfig.from_serializable(jsonable, cache=True)
+    assert config == QuantinuumConfig.from_serializable(jsonable)
+    assert config is QuantinuumConfig.from_serializable(dict(jsonable), cache=True)
+    assert config is not QuantinuumConfig.from_serializable(jsonable)
+
+
+def test_from_serializable_cache_mutable() -> None:
+    """Test cached deserialization doesn't share configs holding mutable models."""
+    jsonable = SelenePlusConfig(
+        simulator=StatevectorSimulator(seed=1)
+    ).to_serializable()
+
+    config = SelenePlusConfig.from_serializable(jsonable, cache=True)
+    config.simulator.seed = 2
+    other = SelenePlusConfig.from_serializable(jsonable, cache=True)
+    assert other is not config
+    assert other.simulator.seed == 1
+
+
+def test_from_serializable_cache_skips_unrepresentable() -> None:
+    """Test payloads JSON can't represent, and mutable configs, aren't cached."""
+    jsonable = {"type": "HeliosConfig", "max_cost": None}
+    config = HeliosConfig.from_serializable(jsonable, cache=True)
+    assert config is HeliosConfig.from_serializable(dict(jsonable), cache=True)
+    # NaN is dumped as null too, but mustn't be given the cached config.
+    with pytest.deprecated_call():
+        nan_config = HeliosConfig.from_serializable(
+            {**jsonable, "max_cost": float("nan")}, cache=True
+        )
+    assert nan_config.max_cost is not None and math.isnan(nan_config.max_cost)
+
+    selene = SelenePlusConfig().to_serializable()
+    SelenePlusConfig.from_serializable(selene, cache=True)
+    assert all(
+        not isinstance(shared, SelenePlusConfig)
+        for shared in _shared_configs.values()  # pylint: disable=protected-access
+    )
+
+
+def test_base_from_serializable_dispatches_on_type() -> None:
+    """Test from_serializable on the base class returns the config named by type."""
+    jsonable = SeleneConfig(
+        error_model=DepolarizingErrorModel(p_1q=0.1)
+    ).to_serializable()
+    config = BaseBackendConfig.from_serializable(jsonable)
+    assert type(config) is SeleneConfig
+    assert config == SeleneConfig(error_model=DepolarizingErrorModel(p_1q=0.1))
+    assert BaseBackendConfig.from_serializable(jsonable, cache=True) == config
+    for cache in (False, True):
+        for type_ in ("UnknownConfig", ["SeleneConfig"], {"name": "SeleneConfig"}):
+            with pytest.raises(ValidationError):
+                BaseBackendConfig.from_serializable({"type": type_}, cache=cache)
+
+
+def test_backend_config_adapter() -> None:
+    """Test the shared adapter dispatches to the config class named by type."""
+    config = SeleneConfig(error_model=DepolarizingErrorModel(p_1q=0.1))
+    assert BACKEND_CONFIG_ADAPTER.validate_json(config.to_json()) == config
+    assert BACKEND_CONFIG_ADAPTER.validate_python(config.to_serializable()) == config
+    with pytest.raises(ValidationError):
+        BACKEND_CONFIG_ADAPTER.validate_python({"type": "UnknownConfig"})
+
+    assert parse_backend_config(dump_backend_config(config)) == config
+    assert dump_backend_config(config) == config.to_serializable()
+
+
+def test_decode_backend_config() -> None:
+    """Test decoding dispatches directly on the type field."""
+    config = SelenePlusConfig(error_model=DepolarizingErrorModel(p_1q=0.1))
+    decoded = decode_backend_config(config.to_serializable())
+    assert type(decoded) is SelenePlusConfig
+    assert decoded == config
+    with pytest.raises(ValidationError):
+        decode_backend_config({"type": "UnknownConfig"})
+    with pytest.raises(ValidationError):
+        decode_backend_config({})
+    with pytest.raises(ValidationError):
+        decode_backend_config({"type": ["AerConfig"]})
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SelenePlusConfig(
+            simulator=StabilizerSimulator(angle_threshold=0.1),
+            runtime=HeliosRuntime(seed=3),
+            error_model=QSystemErrorModel(name="beta"),
+        ),
+        HeliosConfig(
+            system_name="Helios-1E",
+            emulator_config=HeliosEmulatorConfig(simulator=CoinflipSimulator(bias=0.2)),
+        ),
+        AerConfig(noise_model={"errors": []}),  # type: ignore[arg-type]
+        QuantinuumConfig(
+            device_name="H2-1E",
+            compiler_options=QuantinuumCompilerOptions(max_planning=601),  # type: ignore[call-arg]
+        ),
+        QuantinuumConfig(
+            device_name="H2-1",
+            batch_id=uuid4(),
+            attempt_batching=True,
+            error_params=UserErrorParams(p_meas=(0.01, 0.02)),
+        ),
+    ],
+)
+def test_from_trusted(config: BaseBackendConfig) -> None:
+    """Test constructing without validation rebuilds nested models from a dump or JSON."""
+    assert BaseBackendConfig.from_trusted(config.model_dump()) == config
+    assert type(config).from_trusted(config.model_dump()) == config
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        trusted = BaseBackendConfig.from_trusted(orjson.loads(config.to_json()))
+        assert trusted == config
+        assert trusted.to_json() == config.to_json()
+
+
+def test_parse_backend_configs_json() -> None:
+    """Test a JSON array of mixed configs is parsed to the right classes."""
+    configs = [SeleneConfig(), QuantinuumConfig(device_name="H2-1E"), AerConfig()]
+    raw = b"[" + b",".join(config.to_json() for config in configs) + b"]"
+    assert parse_backend_configs_json(raw) == configs
+
+
+def test_config_name_to_class() -> None:
+    """Test every backend config is registered under its class name."""
+    assert config_name_to_class["AerConfig"] is AerConfig
+    assert config_name_to_class["HeliosConfig"] is HeliosConfig
+    assert all(name == cls.__name__ for name, cls in config_name_to_class.items())
+    assert all(
+        name == cls.model_fields["type"].default
+        for name, cls in config_name_to_class.items()
+    )
+    with pytest.raises(TypeError):
+        config_name_to_class["AerConfig"] = HeliosConfig  # type: ignore[index]
+
+
+def test_registry_matches_backend_config_union() -> None:
+    """Test every registered config is a member of the BackendConfig union, and vice versa."""
+    assert dict(config_name_to_class) == dict(
+        _DISCRIMINATOR_MAP  # pylint: disable=protected-access
+    )
+
+
+def test_registry_ignores_subclass_reusing_name() -> None:
+    """Test a subclass named like a registered config doesn't replace it."""
+    # As a downstream module defining `class AerConfig(AerConfig)` would.
+    shadow = type("AerConfig", (AerConfig,), {})
+    assert config_name_to_class["AerConfig"] is AerConfig
+    trusted = BaseBackendConfig.from_trusted({"type": "AerConfig"})
+    assert type(trusted) is AerConfig
+    assert type(trusted) is not shadow
+
+
+@pytest.mark.parametrize("config_class", list(config_name_to_class.values()))
+def test_deferred_schemas_resolve(config_class: type[BaseModel]) -> None:
+    """Test the deferred schema of every backend config can be built."""
+    assert config_class.model_json_schema()["title"] == config_class.__name__
+
+
+def test_build_schemas() -> None:
+    """Test building the schemas up front completes every config and adapter."""
+    build_schemas()
+    assert all(cls.__pydantic_complete__ for cls in config_name_to_class.values())
+    assert BACKEND_CONFIG_ADAPTER.pydantic_complete
+
+
+BRAKET_REMOTE_PARAMS = {
+    "device_type": "qpu",
+    "provider": "ionq",
+    "device": "Aria-1",
+    "s3_bucket": "bucket",
+    "s3_folder": "folder",
+}
+
+
+def test_braket_config_local_remote_consistency() -> None:
+    """Test BraketConfig accepts consistent local or remote parameters only."""
+    BraketConfig.model_validate({"local": True})
+    BraketConfig.model_validate({"local": False, **BRAKET_REMOTE_PARAMS})
+    BraketConfig.model_validate({"local": True, **dict.fromkeys(BRAKET_REMOTE_PARAMS)})
+
+    with pytest.raises(ValidationError):
+        BraketConfig.model_validate({"local": True, "device": "Aria-1"})
+    with pytest.raises(ValidationError):
+        BraketConfig.model_validate({"local": False})
+    with pytest.raises(ValidationError):
+        BraketConfig.model_validate(
+            {"local": False, **BRAKET_REMOTE_PARAMS, "s3_folder": None}
+        )
+
+
+class FakeQiskitNoiseModel:  # pylint: disable=too-few-public-methods
+    """Stand-in for a qiskit-aer NoiseModel."""
+
+    def to_dict(self, serializable: bool = False) -> dict[str, list[object]]:
+        """Mimic NoiseModel.to_dict."""
+        assert serializable
+        return {"errors": []}
+
+
+@pytest.mark.parametrize(
+    "noise_model",
+    [{"errors": []}, FakeQiskitNoiseModel()],
+)
+def test_aer_noise_model_inputs(noise_model: object) -> None:
+    """Test the accepted forms of AerConfig.noise_model are all validated."""
+    config = AerConfig(noise_model=noise_model)  # type: ignore[arg-type]
+    assert config.noise_model is not None
+    assert AerConfig(noise_model=config.noise_model) == config
+
+    for invalid in (1, '{"errors": []}', b'{"errors": []}'):
+        with pytest.raises(ValidationError):
+            AerConfig(noise_model=invalid)  # type: ignore[arg-type]
+
+
+def test_aer_noise_model_error_location() -> None:
+    """Test errors in a noise model dict are reported at their location in the model."""
+    with pytest.raises(ValidationError) as excinfo:
+        AerConfig(noise_model={"errors": [{"type": "roerror"}]})  # type: ignore[arg-type]
+    assert excinfo.value.errors()[0]["loc"][:3] == ("noise_model", "errors", 0)
+
+
 def test_valid_quantinuum_compiler_options() -> None:
     """Test to ensure that all expected arguments can be accepted by the compiler options class"""
     dict_of_options = {
@@ -48,12 +312,18 @@ def test_valid_quantinuum_compiler_options() -> None:
     QuantinuumCompilerOptions(**dict_of_options)
 
 
-def test_handling_invalid_option() -> None:
-    """Expect an assert error raised when passing a bad compiler option"""
-    dict_of_options = {
-        "DD_threshold_times": [0.1, 3, 0.3],
-    }
-
+@pytest.mark.parametrize(
+    "dict_of_options",
+    [
+        {"DD_threshold_times": [0.1, 3, 0.3]},
+        {"DD_threshold_times": [0.1, True]},
+        {"DD_threshold_times": (0.1, 0.2)},
+        {"expect_threshold": {"nested": 0.5}},
+        {"CF": None},
+    ],
+)
+def test_handling_invalid_option(dict_of_options: dict[str, object]) -> None:
+    """Expect a validation error raised when passing a bad compiler option"""
     with pytest.raises(ValidationError):
         QuantinuumCompilerOptions(**dict_of_options)
 
@@ -0,0 +1,28 @@
+"""Test the base model helpers."""
+
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+from quantinuum_schemas.models.base import BaseModel, construct_trusted
+
+
+class _Inner(BaseModel):
+    a: int = 0
+    t: Tuple[int, int] = (0, 0)
+
+
+class _Outer(BaseModel):
+    models: Dict[str, _Inner]
+    pairs: Optional[Dict[str, Tuple[int, int]]] = None
+
+
+def test_construct_trusted_dict_of_models() -> None:
+    """Test models and tuples held in a dict field are rebuilt, not the dict itself."""
+    outer = _Outer(models={"x": _Inner(a=1, t=(1, 2))}, pairs={"y": (3, 4)})
+
+    assert construct_trusted(_Outer, outer.model_dump()) == outer
+    trusted = construct_trusted(_Outer, orjson.loads(outer.to_json()))
+    assert trusted == outer
+    assert isinstance(trusted.models["x"], _Inner)
+    assert trusted.pairs == {"y": (3, 4)}
@@ -1,5 +1,9 @@
 """Test hypertket config model."""
 
+import orjson
+from pydantic import BaseModel
+
+from quantinuum_schemas.models.base import construct_trusted
 from quantinuum_schemas.models.hypertket_config import (
     DualStrat,
     HyperTketConfig,
@@ -21,3 +25,30 @@ def test_enum_serialization() -> None:
     serialised = config.model_dump()
 
     HyperTketConfig.model_validate(serialised)
+
+
+def test_json_roundtrip() -> None:
+    """Test from_json restores the output of to_json."""
+    config = HyperTketConfig(
+        qubit_reuse_config=QubitReuseConfig(dual_circuit_strategy=DualStrat.AUTO)
+    )
+
+    assert HyperTketConfig.from_json(config.to_json()) == config
+
+
+def test_from_trusted_json() -> None:
+    """Test from_trusted restores the output of to_json, enum values included."""
+    config = HyperTketConfig(
+        qubit_reuse_config=QubitReuseConfig(dual_circuit_strategy=DualStrat.AUTO)
+    )
+
+    assert HyperTketConfig.from_trusted(orjson.loads(config.to_json())) == config
+
+
+class _EnumModel(BaseModel):
+    strategy: DualStrat
+
+
+def test_construct_trusted_enum() -> None:
+    """Test enums are rebuilt from their values for models that store enums."""
+    assert construct_trusted(_EnumModel, {"strategy": 2}).strategy is DualStrat.AUTO
@@ -0,0 +1,70 @@
+"""Test Quantinuum systems noise models."""
+
+import warnings
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from quantinuum_schemas.models.quantinuum_systems_noise import (
+    HeliosErrorParams,
+    UserErrorParams,
+    parse_helios_error_params,
+)
+
+
+@pytest.mark.parametrize(
+    "p_meas,expected",
+    [
+        (None, None),
+        (0.01, 0.01),
+        (1, 1.0),
+        ([0.01, 0.02], (0.01, 0.02)),
+        ((0.01, 0.02), (0.01, 0.02)),
+    ],
+)
+def test_p_meas(p_meas: object, expected: object) -> None:
+    """Test p_meas accepts a single error rate or a pair of rates."""
+    params = UserErrorParams(p_meas=p_meas)  # type: ignore[arg-type]
+    assert params.p_meas == expected
+    assert type(params.p_meas) is type(expected)
+
+
+def test_from_trusted_json() -> None:
+    """Test from_trusted restores tuples from the lists of a JSON payload."""
+    params = UserErrorParams(p_meas=(0.01, 0.02))
+    trusted = UserErrorParams.from_trusted(orjson.loads(params.to_json()))
+    assert trusted == params
+    assert trusted.p_meas == (0.01, 0.02)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        trusted.model_dump()
+
+
+def test_invalid_p_meas() -> None:
+    """Test p_meas rejects anything that isn't a float or a pair of floats."""
+    with pytest.raises(ValidationError):
+        UserErrorParams(p_meas=[0.01, 0.02, 0.03])  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("n_set", range(5))
+def test_przz_params_all_or_none(n_set: int) -> None:
+    """Test the przz parameters must be set together or not at all."""
+    przz = dict(zip(("przz_a", "przz_b", "przz_c", "przz_d"), [0.5] * n_set))
+    if n_set in (0, 4):
+        HeliosErrorParams.model_validate(przz)
+    else:
+        with pytest.raises(ValidationError):
+            HeliosErrorParams.model_validate(przz)
+
+
+def test_parse_helios_error_params() -> None:
+    """Test a list of parameter sets is validated in one call, aliases included."""
+    params = parse_helios_error_params([{"p1": 0.1}, {"p_prep": 0.2}, {}])
+    assert params == [
+        HeliosErrorParams(p1=0.1),
+        HeliosErrorParams(p_init=0.2),
+        HeliosErrorParams(),
+    ]
+    with pytest.raises(ValidationError):
+        parse_helios_error_params([{"p1": 0.1}, {"p1": 2.0}])
@@ -1,10 +1,9 @@
 """Tests for result types."""
 
 import pytest
-from pydantic import BaseModel
-from pydantic.error_wrappers import ValidationError
+from pydantic import BaseModel, ValidationError
 
-from quantinuum_schemas.models.result import QSysResult
+from quantinuum_schemas.models.result import QSYS_RESULT_ADAPTER, QSysResult
 
 
 def test_result_serialisation() -> None:
@@ -48,3 +47,18 @@ def test_result_serialisation() -> None:
 
     with pytest.raises(ValidationError):
         TestResultModel(result=test_result_2)  # type: ignore[arg-type]
+
+
+def test_result_adapter() -> None:
+    """Test results can be validated with the shared adapter, without a wrapper model."""
+    result = QSYS_RESULT_ADAPTER.validate_python(
+        [[["test_key_1", 1], ["test_key_2", [True, 0]]]]
+    )
+    assert result == [[("test_key_1", 1), ("test_key_2", [True, 0])]]
+    assert (
+        QSYS_RESULT_ADAPTER.validate_json(QSYS_RESULT_ADAPTER.dump_json(result))
+        == result
+    )
+
+    with pytest.raises(ValidationError):
+        QSYS_RESULT_ADAPTER.validate_python([[["test_key_1", "hello"]]])
@@ -0,0 +1,62 @@
+"""Test lazy loading of the top-level package exports."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import quantinuum_schemas
+
+
+def test_import_does_not_load_models() -> None:
+    """Importing the package should not import any of the model modules."""
+    code = (
+        "import sys; import quantinuum_schemas; "
+        "assert not [m for m in sys.modules if m.startswith('quantinuum_schemas.models')]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize(
+    "name,module,attr",
+    quantinuum_schemas._EXPORTS,  # pylint: disable=protected-access
+)
+def test_public_api_is_complete(name: str, module: str, attr: str) -> None:
+    """Every export is listed in __all__ and resolves to its source attribute."""
+    assert name in quantinuum_schemas.__all__
+    assert getattr(quantinuum_schemas, name) is getattr(
+        importlib.import_module(module), attr
+    )
+
+
+def test_lazy_attribute_access() -> None:
+    """Exported names resolve to the classes defined in the model modules."""
+    from quantinuum_schemas.models.backend_config import (  # pylint: disable=import-outside-toplevel
+        AerConfig,
+    )
+
+    assert quantinuum_schemas.AerConfig is AerConfig
+    assert "AerConfig" in dir(quantinuum_schemas)
+
+
+def test_backend_config_defers_aer_noise() -> None:
+    """The Aer noise models should only be imported once AerConfig is used."""
+    code = (
+        "import sys; from quantinuum_schemas.models import backend_config; "
+        "assert 'quantinuum_schemas.models.aer_noise' not in sys.modules; "
+        "backend_config.AerConfig(noise_model={'errors': []}); "
+        "assert 'quantinuum_schemas.models.aer_noise' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_backend_config_reexports_aer_noise() -> None:
+    """The Aer noise models can still be imported from backend_config."""
+    from quantinuum_schemas.models import (  # pylint: disable=import-outside-toplevel
+        aer_noise,
+        backend_config,
+    )
+
+    assert backend_config.AerNoiseModel is aer_noise.AerNoiseModel
+    assert backend_config.CrosstalkParams is aer_noise.CrosstalkParams